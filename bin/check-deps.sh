@@ -11,96 +11,166 @@
 #   bin/check-deps.sh         # Check and update if needed
 #   bin/check-deps.sh --force # Force recheck
 #   bin/check-deps.sh --dry-run # Show what would happen
+#   bin/check-deps.sh --quiet   # Only print warnings and breaking changes
 
 set -euo pipefail
 
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+PROJECT_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
 CARGO_TOML="$PROJECT_ROOT/Cargo.toml"
 CHECKSUM_FILE="$PROJECT_ROOT/.cargo-deps-checksum"
 
-# Colors
-RED='\033[0;31m'
-YELLOW='\033[1;33m'
-GREEN='\033[0;32m'
-BLUE='\033[0;36m'
-NC='\033[0m' # No Color
+# Colors (real escape bytes, so output needs no echo -e interpretation)
+# Only emitted when stdout is a terminal and NO_COLOR is unset
+if [[ -t 1 ]] && [[ -z "${NO_COLOR:-}" ]]; then
+    YELLOW=$'\033[1;33m'
+    GREEN=$'\033[0;32m'
+    BLUE=$'\033[0;36m'
+    NC=$'\033[0m' # No Color
+else
+    YELLOW="" GREEN="" BLUE="" NC=""
+fi
+
+# Errors go to stderr, so their colors follow stderr's terminal check instead
+if [[ -t 2 ]] && [[ -z "${NO_COLOR:-}" ]]; then
+    RED_ERR=$'\033[0;31m'
+    NC_ERR=$'\033[0m'
+else
+    RED_ERR="" NC_ERR=""
+fi
+
+# Message prefixes, shared by the log_* functions and report_line
+INFO_PREFIX="${BLUE}ℹ ${NC}"
+WARNING_PREFIX="${YELLOW}⚠${NC} "
 
 DRY_RUN=false
 FORCE=false
+QUIET=false
+
+usage() {
+    echo "Usage: $0 [--dry-run] [--force] [-q|--quiet]"
+    echo ""
+    echo "Options:"
+    echo "  --dry-run    Show what would happen without making changes"
+    echo "  --force      Force recheck even if checksum hasn't changed"
+    echo "  -q, --quiet  Suppress info output; only warnings and breaking changes"
+}
 
-# Parse args
+# Parse args - bad options exit before any git or Cargo.toml work
 for arg in "$@"; do
     case $arg in
         --dry-run) DRY_RUN=true ;;
         --force) FORCE=true ;;
+        -q|--quiet) QUIET=true ;;
         -h|--help)
-            echo "Usage: $0 [--dry-run] [--force]"
-            echo ""
-            echo "Options:"
-            echo "  --dry-run    Show what would happen without making changes"
-            echo "  --force      Force recheck even if checksum hasn't changed"
+            usage
             exit 0
             ;;
+        *)
+            echo "Unknown option: $arg" >&2
+            usage >&2
+            exit 2
+            ;;
     esac
 done
 
 log_info() {
-    echo -e "${BLUE}ℹ ${NC}$*"
+    [[ "$QUIET" == "true" ]] && return 0
+    printf '%s\n' "${INFO_PREFIX}$*"
 }
 
 log_success() {
-    echo -e "${GREEN}✓${NC} $*"
+    [[ "$QUIET" == "true" ]] && return 0
+    printf '%s\n' "${GREEN}✓${NC} $*"
 }
 
 log_warning() {
-    echo -e "${YELLOW}⚠${NC} $*"
+    printf '%s\n' "${WARNING_PREFIX}$*"
 }
 
 log_error() {
-    echo -e "${RED}✗${NC} $*" >&2
+    printf '%s\n' "${RED_ERR}✗${NC_ERR} $*" >&2
+}
+
+# Append a per-package line to report, indented under a log prefix.
+# The formatted line is left in REPORT_LINE for callers that need it twice
+report_line() {
+    REPORT_LINE="$1  $2"$'\n'
+    report+=$REPORT_LINE
+}
+
+# Print the [dependencies] block of a manifest read from stdin.
+# A range pattern (/^\[dependencies\]/,/^\[/) closes on the header line
+# itself, so track the current section with a flag instead. Reading stops
+# at the next table header; the rest of the manifest is never scanned.
+deps_section() {
+    awk '/^\[/ { if (in_deps) exit; in_deps = ($0 ~ /^\[dependencies\]/); next }
+         in_deps && /^[a-z].*=/'
 }
 
 # Extract dependencies section from Cargo.toml (just the [dependencies] block)
 extract_deps() {
-    awk '/^\[dependencies\]/,/^\[/' "$CARGO_TOML" | grep -E "^[a-z].*=" || true
+    deps_section < "$CARGO_TOML"
 }
 
-# Calculate checksum of dependencies
+# Calculate checksum of an extracted dependencies block
 calc_checksum() {
-    extract_deps | sha256sum | cut -d' ' -f1
+    local deps="$1" sum _
+    [[ -n "$deps" ]] && deps+=$'\n'
+    read -r sum _ < <(printf '%s' "$deps" | sha256sum)
+    echo "$sum"
 }
 
-# Parse version from dependency line
-parse_version() {
-    local dep_line="$1"
+# Reduce dependency lines to "name version" pairs in a single pass
+parse_deps() {
     # Handle: serde = { version = "1.0.226", ... }
     # or:     serde = "1.0.226"
-    echo "$dep_line" | grep -oP 'version\s*=\s*"\K[^"]+' || \
-    echo "$dep_line" | grep -oP '=\s*"\K[^"]+' || echo ""
+    # Local deps ({ path = ... }, { git = ... }, { workspace = true }) without
+    # a version key get an empty version so callers skip them
+    awk '{
+        name = $0
+        sub(/[ \t]*=.*/, "", name)
+        ver = ""
+        if (match($0, /version[ \t]*=[ \t]*"[^"]+"/) || match($0, /^[^=]*=[ \t]*"[^"]+"/)) {
+            ver = substr($0, RSTART, RLENGTH)
+            sub(/^[^"]*"/, "", ver)
+            sub(/"$/, "", ver)
+        }
+        print name, ver
+    }'
 }
 
-# Get major version number
-major_version() {
-    local ver="$1"
-    echo "$ver" | cut -d. -f1
+# Leading major[.minor] of a version, after any requirement operator
+VERSION_RE='^[=^~<>[:space:]]*([0-9]+)(\.([0-9]+))?'
+
+# Split a version into VER_MAJOR / VER_MINOR without forking
+# Handles: 1.0.226, ^0.9, =2
+split_version() {
+    VER_MAJOR=""
+    VER_MINOR=""
+    if [[ "$1" =~ $VERSION_RE ]]; then
+        VER_MAJOR=$((10#${BASH_REMATCH[1]}))
+        VER_MINOR=$((10#${BASH_REMATCH[3]:-0}))
+    fi
 }
 
-# Compare two dependency versions
-is_breaking_change() {
-    local old_ver="$1"
-    local new_ver="$2"
-
-    # Extract major version
-    local old_major=$(major_version "$old_ver")
-    local new_major=$(major_version "$new_ver")
-
-    # If major version increased, it's breaking
-    if [[ "$new_major" -gt "$old_major" ]]; then
-        return 0  # true
+# Classify a version change into CHANGE_KIND: breaking, minor or patch
+# Each version is split once. A major version increase is breaking, and so
+# is a minor increase within 0.x (Cargo treats 0.9 -> 0.10 as incompatible)
+classify_change() {
+    split_version "$1"
+    local old_major=$VER_MAJOR old_minor=$VER_MINOR
+    split_version "$2"
+    local new_major=$VER_MAJOR new_minor=$VER_MINOR
+
+    if [[ -n "$old_major" ]] && [[ -n "$new_major" ]] && [[ "$new_major" -gt "$old_major" ]]; then
+        CHANGE_KIND=breaking
+    elif [[ "$old_major" == "0" ]] && [[ "$new_major" == "0" ]] && [[ "$new_minor" -gt "$old_minor" ]]; then
+        CHANGE_KIND=breaking
+    elif [[ "$new_minor" -gt "$old_minor" ]] 2>/dev/null; then
+        CHANGE_KIND=minor
+    else
+        CHANGE_KIND=patch
     fi
-
-    return 1  # false
 }
 
 # Main logic
@@ -109,19 +179,39 @@ main() {
 
     log_info "Checking Cargo.toml dependencies..."
 
+    # Checksum file stores "checksum size"; the size guards the mtime fast path
+    # against copies that preserve an older mtime (cp -p, rsync -a, tar x)
+    cargo_size=$(( $(wc -c < "$CARGO_TOML") ))
+    previous_checksum=""
+    previous_size=""
+    if [[ -f "$CHECKSUM_FILE" ]]; then
+        read -r previous_checksum previous_size < "$CHECKSUM_FILE" || true
+    fi
+
+    # Cargo.toml not modified since the checksum was stored - skip hashing
+    if [[ "$FORCE" != "true" ]] && [[ "$CHECKSUM_FILE" -nt "$CARGO_TOML" ]] && \
+       [[ "$previous_size" == "$cargo_size" ]]; then
+        log_success "Dependencies unchanged"
+        exit 0
+    fi
+
+    # Read Cargo.toml once; the same block feeds the checksum and the comparison
+    deps_block=$(extract_deps)
+
     # Calculate current checksum
-    current_checksum=$(calc_checksum)
+    current_checksum=$(calc_checksum "$deps_block")
 
-    # Read previous checksum if exists
-    if [[ -f "$CHECKSUM_FILE" ]]; then
-        previous_checksum=$(cat "$CHECKSUM_FILE")
-    else
-        previous_checksum=""
+    if [[ -z "$previous_checksum" ]]; then
         log_warning "No previous checksum found - initializing"
     fi
 
     # Check if changed
     if [[ "$current_checksum" == "$previous_checksum" ]] && [[ "$FORCE" != "true" ]]; then
+        # Refresh the stored size/mtime so edits outside [dependencies]
+        # (e.g. a semv version bump) don't disable the fast path
+        if [[ "$DRY_RUN" != "true" ]]; then
+            echo "$current_checksum $cargo_size" > "$CHECKSUM_FILE"
+        fi
         log_success "Dependencies unchanged"
         exit 0
     fi
@@ -129,7 +219,7 @@ main() {
     if [[ -z "$previous_checksum" ]]; then
         log_info "First run - storing baseline checksum"
         if [[ "$DRY_RUN" != "true" ]]; then
-            echo "$current_checksum" > "$CHECKSUM_FILE"
+            echo "$current_checksum $cargo_size" > "$CHECKSUM_FILE"
             log_success "Baseline stored"
         else
             log_info "[DRY-RUN] Would store baseline checksum"
@@ -140,8 +230,8 @@ main() {
     log_warning "Dependencies have changed!"
 
     # Extract old and new deps
-    old_deps=$(git show "HEAD:Cargo.toml" 2>/dev/null | awk '/^\[dependencies\]/,/^\[/' | grep -E "^[a-z].*=" || true)
-    new_deps=$(extract_deps)
+    old_deps=$(git show "HEAD:Cargo.toml" 2>/dev/null | deps_section | parse_deps || true)
+    new_deps=$(printf '%s' "$deps_block" | parse_deps)
 
     breaking_changes=()
     minor_changes=()
@@ -149,115 +239,105 @@ main() {
     new_packages=()
     removed_packages=()
 
-    # Compare versions
-    while IFS= read -r new_line; do
-        [[ -z "$new_line" ]] && continue
-        pkg_name=$(echo "$new_line" | cut -d= -f1 | tr -d ' ')
-        new_ver=$(parse_version "$new_line")
+    # Per-package lines are collected here and written out in one go;
+    # breaking lines are also kept apart so --quiet can still show them
+    report=""
+    breaking_report=""
 
-        # Find matching old line
-        old_line=$(echo "$old_deps" | grep "^$pkg_name\s*=" || true)
+    # Index old versions by package name for constant-time lookups
+    declare -A old_versions=()
+    while read -r pkg_name old_ver; do
+        [[ -n "$pkg_name" ]] && old_versions[$pkg_name]=$old_ver
+    done <<< "$old_deps"
+
+    # Compare versions
+    declare -A new_names=()
+    while read -r pkg_name new_ver; do
+        [[ -z "$pkg_name" ]] && continue
+        new_names[$pkg_name]=1
 
-        if [[ -n "$old_line" ]] && [[ -n "$new_ver" ]]; then
-            old_ver=$(parse_version "$old_line")
+        if [[ -n "${old_versions[$pkg_name]+set}" ]] && [[ -n "$new_ver" ]]; then
+            old_ver=${old_versions[$pkg_name]}
 
             if [[ -n "$old_ver" ]] && [[ "$old_ver" != "$new_ver" ]]; then
-                if is_breaking_change "$old_ver" "$new_ver"; then
-                    log_warning "  Breaking: $pkg_name $old_ver → $new_ver"
-                    breaking_changes+=("$pkg_name: $old_ver → $new_ver")
-                else
-                    # Check if minor or patch
-                    old_minor=$(echo "$old_ver" | cut -d. -f2)
-                    new_minor=$(echo "$new_ver" | cut -d. -f2)
-                    if [[ "$new_minor" -gt "$old_minor" ]] 2>/dev/null; then
-                        log_info "  Minor: $pkg_name $old_ver → $new_ver"
+                classify_change "$old_ver" "$new_ver"
+                case $CHANGE_KIND in
+                    breaking)
+                        report_line "$WARNING_PREFIX" "Breaking: $pkg_name $old_ver → $new_ver"
+                        breaking_report+=$REPORT_LINE
+                        breaking_changes+=("$pkg_name: $old_ver → $new_ver")
+                        ;;
+                    minor)
+                        report_line "$INFO_PREFIX" "Minor: $pkg_name $old_ver → $new_ver"
                         minor_changes+=("$pkg_name: $old_ver → $new_ver")
-                    else
-                        log_info "  Patch: $pkg_name $old_ver → $new_ver"
+                        ;;
+                    patch)
+                        report_line "$INFO_PREFIX" "Patch: $pkg_name $old_ver → $new_ver"
                         patch_changes+=("$pkg_name: $old_ver → $new_ver")
-                    fi
-                fi
+                        ;;
+                esac
             fi
         elif [[ -n "$new_ver" ]]; then
-            log_info "  New: $pkg_name $new_ver"
+            report_line "$INFO_PREFIX" "New: $pkg_name $new_ver"
             new_packages+=("$pkg_name: $new_ver")
         fi
     done <<< "$new_deps"
 
     # Check for removed packages
-    while IFS= read -r old_line; do
-        [[ -z "$old_line" ]] && continue
-        pkg_name=$(echo "$old_line" | cut -d= -f1 | tr -d ' ')
-        old_ver=$(parse_version "$old_line")
+    while read -r pkg_name old_ver; do
+        [[ -z "$pkg_name" ]] || [[ -z "$old_ver" ]] && continue
 
         # Check if still exists
-        if ! echo "$new_deps" | grep -q "^$pkg_name\s*="; then
-            log_info "  Removed: $pkg_name $old_ver"
+        if [[ -z "${new_names[$pkg_name]+set}" ]]; then
+            report_line "$INFO_PREFIX" "Removed: $pkg_name $old_ver"
             removed_packages+=("$pkg_name: $old_ver")
         fi
     done <<< "$old_deps"
 
+    if [[ "$QUIET" == "true" ]]; then
+        [[ -n "$breaking_report" ]] && printf '%s' "$breaking_report"
+    else
+        [[ -n "$report" ]] && printf '%s' "$report"
+    fi
+
     # Build commit message with all changes
     total_changes=$((${#breaking_changes[@]} + ${#minor_changes[@]} + ${#patch_changes[@]} + ${#new_packages[@]} + ${#removed_packages[@]}))
 
     if [[ $total_changes -eq 0 ]]; then
         log_success "No changes detected"
         if [[ "$DRY_RUN" != "true" ]]; then
-            echo "$current_checksum" > "$CHECKSUM_FILE"
+            echo "$current_checksum $cargo_size" > "$CHECKSUM_FILE"
         fi
         exit 0
     fi
 
-    # Build commit message body
+    # Build commit message body - one section per non-empty change list
     commit_body=""
 
-    if [[ ${#breaking_changes[@]} -gt 0 ]]; then
-        commit_body+="Breaking Changes:\n"
-        for change in "${breaking_changes[@]}"; do
-            commit_body+="  - $change\n"
-        done
-        commit_body+="\n"
-    fi
-
-    if [[ ${#minor_changes[@]} -gt 0 ]]; then
-        commit_body+="Minor Updates:\n"
-        for change in "${minor_changes[@]}"; do
-            commit_body+="  - $change\n"
+    for section in \
+        "breaking_changes:Breaking Changes" \
+        "minor_changes:Minor Updates" \
+        "patch_changes:Patch Updates" \
+        "new_packages:New Packages" \
+        "removed_packages:Removed Packages"; do
+        entries="${section%%:*}[@]"
+        changes=("${!entries}")
+        [[ ${#changes[@]} -gt 0 ]] || continue
+
+        commit_body+="${section#*:}:"$'\n'
+        for change in "${changes[@]}"; do
+            commit_body+="  - $change"$'\n'
         done
-        commit_body+="\n"
-    fi
-
-    if [[ ${#patch_changes[@]} -gt 0 ]]; then
-        commit_body+="Patch Updates:\n"
-        for change in "${patch_changes[@]}"; do
-            commit_body+="  - $change\n"
-        done
-        commit_body+="\n"
-    fi
-
-    if [[ ${#new_packages[@]} -gt 0 ]]; then
-        commit_body+="New Packages:\n"
-        for change in "${new_packages[@]}"; do
-            commit_body+="  - $change\n"
-        done
-        commit_body+="\n"
-    fi
-
-    if [[ ${#removed_packages[@]} -gt 0 ]]; then
-        commit_body+="Removed Packages:\n"
-        for change in "${removed_packages[@]}"; do
-            commit_body+="  - $change\n"
-        done
-        commit_body+="\n"
-    fi
+        commit_body+=$'\n'
+    done
 
     commit_body+="Automated dependency analysis via check-deps.sh"
+    commit_msg="breaking: update dependencies with breaking changes"$'\n\n'"$commit_body"
 
     # If breaking changes detected, trigger major bump
     if [[ ${#breaking_changes[@]} -gt 0 ]]; then
         log_error "Breaking dependency changes detected!"
-        echo ""
-        echo -e "$commit_body"
+        printf '\n%s\n' "$commit_body"
 
         if command -v semv &> /dev/null; then
             current_version=$(semv version 2>/dev/null || echo "unknown")
@@ -270,9 +350,7 @@ main() {
                 if [[ $REPLY =~ ^[Yy]$ ]]; then
                     log_info "Creating commit with detailed changes..."
                     git add Cargo.toml
-                    git commit -m "breaking: update dependencies with breaking changes
-
-$(echo -e "$commit_body")" || true
+                    git commit -m "$commit_msg" || true
 
                     log_info "Running: semv bump --force"
                     semv bump --force
@@ -283,30 +361,23 @@ $(echo -e "$commit_body")" || true
             else
                 log_info "[DRY-RUN] Would prompt for major version bump"
                 log_info "[DRY-RUN] Commit message would be:"
-                echo ""
-                echo "breaking: update dependencies with breaking changes"
-                echo ""
-                echo -e "$commit_body"
+                printf '\n%s\n' "$commit_msg"
             fi
         else
             log_warning "semv not found - cannot auto-bump version"
             log_info "Install semv or manually bump version"
             log_info "Suggested commit message:"
-            echo ""
-            echo "breaking: update dependencies with breaking changes"
-            echo ""
-            echo -e "$commit_body"
+            printf '\n%s\n' "$commit_msg"
         fi
     else
         log_success "No breaking changes detected"
         log_info "Summary of changes:"
-        echo ""
-        echo -e "$commit_body"
+        [[ "$QUIET" != "true" ]] && printf '\n%s\n' "$commit_body"
     fi
 
     # Update checksum
     if [[ "$DRY_RUN" != "true" ]]; then
-        echo "$current_checksum" > "$CHECKSUM_FILE"
+        echo "$current_checksum $cargo_size" > "$CHECKSUM_FILE"
         log_success "Checksum updated"
     else
         log_info "[DRY-RUN] Would update checksum"
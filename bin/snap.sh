@@ -14,8 +14,10 @@ fi
 mkdir -p "$SNAP_DIR"
 
 # copy each benchmark directory preserving baseline structure
-find "$TARGET_DIR" -maxdepth 1 -mindepth 1 -type d | while read -r bench_dir; do
-  bench_name="$(basename "$bench_dir")"
+for bench_dir in "$TARGET_DIR"/*/; do
+  [ -d "$bench_dir" ] || continue
+  bench_dir="${bench_dir%/}"
+  bench_name="${bench_dir##*/}"
   rsync -a --delete "$bench_dir/" "$SNAP_DIR/$bench_name/"
   echo "Saved $bench_name to meta/snaps/$bench_name"
 done
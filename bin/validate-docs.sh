@@ -53,17 +53,35 @@ check_dir() {
 }
 
 # Function to check file staleness
+# Takes "file:max_days:description" entries; all mtimes come from one stat call
 check_staleness() {
-    local file="$1"
-    local max_days="$2"
-    local description="$3"
-
-    if [[ -f "$file" ]]; then
-        local file_age=$(( ($(date +%s) - $(stat -c %Y "$file")) / 86400 ))
+    local entry file rest max_days description mtime now
+    local -a files=()
+    local -A mtimes=()
+
+    for entry in "$@"; do
+        file="${entry%%:*}"
+        [[ -f "$file" ]] && files+=("$file")
+    done
+    [[ ${#files[@]} -eq 0 ]] && return 0
+
+    while read -r mtime file; do
+        mtimes[$file]=$mtime
+    done < <(stat -c '%Y %n' "${files[@]}")
+    now=$(date +%s)
+
+    for entry in "$@"; do
+        file="${entry%%:*}"
+        rest="${entry#*:}"
+        max_days="${rest%%:*}"
+        description="${rest#*:}"
+        [[ -n "${mtimes[$file]:-}" ]] || continue
+
+        local file_age=$(( (now - mtimes[$file]) / 86400 ))
         if [[ $file_age -gt $max_days ]]; then
             warn "$description is $file_age days old (>$max_days days): $file"
         fi
-    fi
+    done
 }
 
 # Function to check for broken internal references
@@ -97,15 +115,19 @@ check_tool_references() {
     local file="$1"
 
     if [[ -f "$file" ]]; then
+        # Collect every legacy tool mention in a single scan of the file
+        local found
+        found=$(grep -oE 'bin/deps\.py|\./bin/repos\.py|analyze_deps\.sh' "$file" || true)
+
         # Check for outdated tool references
-        if grep -q "bin/deps\.py" "$file"; then
+        if [[ "$found" == *"bin/deps.py"* ]]; then
             warn "Outdated tool reference in $file: bin/deps.py should be blade"
         fi
-        if grep -q "\./bin/repos\.py" "$file"; then
+        if [[ "$found" == *"./bin/repos.py"* ]]; then
             warn "Outdated tool reference in $file: ./bin/repos.py should be blade"
         fi
 
-        if grep -q "analyze_deps\.sh" "$file"; then
+        if [[ "$found" == *"analyze_deps.sh"* ]]; then
             warn "Reference to legacy tool in $file: analyze_deps.sh (may be outdated)"
         fi
     fi
@@ -162,10 +184,11 @@ echo "Checking quality systems..."
 # Staleness checks (only warn, don't error)
 echo "Checking document freshness..."
 
-check_staleness "docs/procs/CONTINUE.md" 7 "Session state"
-check_staleness "docs/procs/QUICK_REF.txt" 7 "Quick reference"
-check_staleness "docs/procs/TASKS.txt" 14 "Task tracking"
-check_staleness "docs/HUB_STRAT.md" 30 "Hub strategy"
+check_staleness \
+    "docs/procs/CONTINUE.md:7:Session state" \
+    "docs/procs/QUICK_REF.txt:7:Quick reference" \
+    "docs/procs/TASKS.txt:14:Task tracking" \
+    "docs/HUB_STRAT.md:30:Hub strategy"
 
 # Reference integrity checks
 echo "Checking reference integrity..."
@@ -215,23 +238,27 @@ fi
 # RESULTS
 ################################################################################
 
-echo
+# Each outcome is written as one block
 if [[ $HAS_ERRORS -eq 0 ]]; then
-    echo -e "${GREEN}✅ Documentation validation passed - no errors found${NC}"
-    echo
-    echo "📊 Validation Summary:"
-    echo "- Core structure: ✅ Complete"
-    echo "- Process docs: ✅ Complete"
-    echo "- Technical docs: ✅ Complete"
-    echo "- Analysis systems: ✅ Complete"
-    echo "- Quality systems: ✅ Complete"
-    echo "- Reference integrity: ✅ Valid"
-    echo
-    echo "🚀 Hub Meta Process v2 system is operational!"
+    printf '%b\n' \
+        "" \
+        "${GREEN}✅ Documentation validation passed - no errors found${NC}" \
+        "" \
+        "📊 Validation Summary:" \
+        "- Core structure: ✅ Complete" \
+        "- Process docs: ✅ Complete" \
+        "- Technical docs: ✅ Complete" \
+        "- Analysis systems: ✅ Complete" \
+        "- Quality systems: ✅ Complete" \
+        "- Reference integrity: ✅ Valid" \
+        "" \
+        "🚀 Hub Meta Process v2 system is operational!"
     exit 0
 else
-    echo -e "${RED}❌ Documentation validation failed - $HAS_ERRORS errors found${NC}"
-    echo
-    echo "Please address the errors above and run validation again."
+    printf '%b\n' \
+        "" \
+        "${RED}❌ Documentation validation failed - $HAS_ERRORS errors found${NC}" \
+        "" \
+        "Please address the errors above and run validation again."
     exit 1
-fi
\ No newline at end of file
+fi
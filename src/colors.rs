@@ -2,7 +2,7 @@
 // Complete 90+ semantic color palette for rich theme support
 // Version: boxy v0.6.0+ (inherits jynx proven architecture)
 
-// Note: Using simple ANSI stripping instead of regex for efficiency
+// Note: Help cells are padded from their plain-text width, so no ANSI stripping is needed
 
 pub const RESET: &str = "\x1B[0m";
 
@@ -166,7 +166,7 @@ pub fn get_color_code(color: &str) -> &'static str {
 /// Validate color name and provide fallback suggestions
 pub fn validate_color(color: &str) -> Result<&'static str, String> {
     let color_code = get_color_code(color);
-    if !color_code.is_empty() || color == "none" || color == "default" || color == "auto" {
+    if !color_code.is_empty() || matches!(color, "none" | "default" | "auto") {
         Ok(color_code)
     } else {
         // Provide fallback suggestions for common typos
@@ -190,69 +190,43 @@ pub fn validate_color(color: &str) -> Result<&'static str, String> {
 }
 
 
+/// Color categories as an immutable const table (no per-call allocation)
+const COLOR_CATEGORIES: &[(&str, &[&str])] = &[
+    ("Legacy Colors (v0.5.0)", &[
+        "red", "red2", "deep", "deep_green", "orange", "yellow", "green", "green2",
+        "blue", "blue2", "cyan", "magenta", "purple", "purple2", "white", "white2",
+        "grey", "grey2", "grey3"
+    ]),
+    ("Red Spectrum", &["crimson", "ruby", "coral", "salmon", "rose", "brick"]),
+    ("Orange Spectrum", &["amber", "tangerine", "peach", "rust", "bronze", "gold"]),
+    ("Yellow Spectrum", &["lemon", "mustard", "sand", "cream", "khaki"]),
+    ("Green Spectrum", &["lime", "emerald", "forest", "mint", "sage", "jade", "olive"]),
+    ("Blue Spectrum", &["azure", "navy", "royal", "ice", "steel", "teal", "indigo"]),
+    ("Purple Spectrum", &["violet", "plum", "lavender", "orchid", "mauve", "amethyst"]),
+    ("Cyan Spectrum", &["aqua", "turquoise", "sky", "ocean"]),
+    ("Monochrome", &["black", "charcoal", "slate", "silver", "pearl", "snow"]),
+    ("Semantic Alerts", &["error", "warning", "danger", "alert"]),
+    ("Semantic Success", &["success", "complete", "verified", "approved"]),
+    ("Semantic Info", &["info", "note", "hint", "debug"]),
+    ("Semantic States", &["pending", "progress", "blocked", "queued", "active", "inactive"]),
+    ("Priority Levels", &["critical", "high", "medium", "low", "trivial"]),
+];
+
 /// Get color categories for organized help display
 pub fn get_color_categories() -> Vec<(&'static str, Vec<&'static str>)> {
-    vec![
-        ("Legacy Colors (v0.5.0)", vec![
-            "red", "red2", "deep", "deep_green", "orange", "yellow", "green", "green2",
-            "blue", "blue2", "cyan", "magenta", "purple", "purple2", "white", "white2",
-            "grey", "grey2", "grey3"
-        ]),
-        ("Red Spectrum", vec!["crimson", "ruby", "coral", "salmon", "rose", "brick"]),
-        ("Orange Spectrum", vec!["amber", "tangerine", "peach", "rust", "bronze", "gold"]),
-        ("Yellow Spectrum", vec!["lemon", "mustard", "sand", "cream", "khaki"]),
-        ("Green Spectrum", vec!["lime", "emerald", "forest", "mint", "sage", "jade", "olive"]),
-        ("Blue Spectrum", vec!["azure", "navy", "royal", "ice", "steel", "teal", "indigo"]),
-        ("Purple Spectrum", vec!["violet", "plum", "lavender", "orchid", "mauve", "amethyst"]),
-        ("Cyan Spectrum", vec!["aqua", "turquoise", "sky", "ocean"]),
-        ("Monochrome", vec!["black", "charcoal", "slate", "silver", "pearl", "snow"]),
-        ("Semantic Alerts", vec!["error", "warning", "danger", "alert"]),
-        ("Semantic Success", vec!["success", "complete", "verified", "approved"]),
-        ("Semantic Info", vec!["info", "note", "hint", "debug"]),
-        ("Semantic States", vec!["pending", "progress", "blocked", "queued", "active", "inactive"]),
-        ("Priority Levels", vec!["critical", "high", "medium", "low", "trivial"]),
-    ]
+    COLOR_CATEGORIES
+        .iter()
+        .map(|&(category, colors)| (category, colors.to_vec()))
+        .collect()
 }
 
-/// Generate colored help text for CLI display
-fn pad_cell(s: &str, width: usize) -> String {
-    // Strip ANSI escape sequences to get actual visible width
-    let visible_text = strip_ansi_codes(s);
-    let visible_len = visible_text.chars().count();
-
-    if visible_len >= width {
-        return s.to_string();
-    }
-
-    let pad = " ".repeat(width - visible_len);
-    format!("{}{}", s, pad)
-}
-
-/// Strip ANSI escape sequences from text for accurate width calculation
-fn strip_ansi_codes(text: &str) -> String {
-    let mut result = String::new();
-    let mut in_escape = false;
-    let mut chars = text.chars();
-
-    while let Some(ch) = chars.next() {
-        if ch == '\x1B' {
-            in_escape = true;
-            continue;
-        }
-
-        if in_escape {
-            if ch.is_alphabetic() {
-                in_escape = false;
-            }
-            continue;
-        }
-
-        result.push(ch);
-    }
-
-    result
+/// Pad a help cell already written to `out` up to `width` visible columns
+fn push_padding(out: &mut String, visible_len: usize, width: usize) {
+    // `visible_len` is the plain-text width, so ANSI codes are never counted
+    out.extend(std::iter::repeat_n(' ', width.saturating_sub(visible_len)));
 }
 
+/// Generate colored help text for CLI display
 pub fn generate_color_help() -> String {
     let mut help = String::new();
     help.push_str("COLORS:\n\n");
@@ -260,27 +234,28 @@ pub fn generate_color_help() -> String {
     let cols = 3usize;
     let cell_w = 20usize; // Optimized for even column spacing
 
-    for (category, colors) in get_color_categories() {
-        help.push_str(&format!("{}:\n", category));
+    // Rows are rendered straight into `help` rather than via per-row Strings
+    for &(category, colors) in COLOR_CATEGORIES {
+        help.push_str(category);
+        help.push_str(":\n");
 
-        let mut i = 0usize;
-        while i < colors.len() {
-            let mut row = String::new();
-            for j in 0..cols {
-                if i + j >= colors.len() { break; }
-                let name = colors[i + j];
+        for row in colors.chunks(cols) {
+            help.push_str("    ");
+            for name in row {
                 let code = get_color_code(name);
-                let cell = if !code.is_empty() {
-                    format!("{}■ {}\x1B[0m", code, name)
+                if !code.is_empty() {
+                    help.push_str(code);
+                    help.push_str("■ ");
+                    help.push_str(name);
+                    help.push_str(RESET);
                 } else {
-                    format!("  {}", name)
-                };
-                row.push_str(&pad_cell(&cell, cell_w));
+                    help.push_str("  ");
+                    help.push_str(name);
+                }
+                // Both cell forms are a two-column marker plus the name
+                push_padding(&mut help, name.chars().count() + 2, cell_w);
             }
-            row.push('\n');
-            help.push_str("    ");
-            help.push_str(&row);
-            i += cols;
+            help.push('\n');
         }
         help.push('\n');
     }
@@ -350,4 +325,13 @@ mod tests {
         let legacy_category = categories.iter().find(|(name, _)| name.contains("Legacy"));
         assert!(legacy_category.is_some());
     }
+
+    #[test]
+    fn test_color_help_cells_padded() {
+        let help = generate_color_help();
+
+        // "■ red" is 5 visible columns, padded to the 20-column cell width
+        let cell = format!("{}■ red{}{}", get_color_code("red"), RESET, " ".repeat(15));
+        assert!(help.contains(&format!("    {}", cell)));
+    }
 }